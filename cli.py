@@ -1,13 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Annotated
 
 import typer
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
-from src import FileManager, Instagram, get_session, setup_logging
+from src import FileManager, get_session, setup_logging
 from src.core.db import Profile, SessionLocal
+from src.utils import DOWNLOAD_WORKERS
 
 app = typer.Typer(
     help="A CLI for managing Instalker target users.",
@@ -42,13 +46,19 @@ def list_users(
     ] = "all",
 ) -> None:
     """Lists all public and private target users in a table from the database."""
-    with _get_db_session() as db:
-        query = db.query(Profile)
-        if privacy == "public":
-            query = query.filter(Profile.is_private.is_(False))
-        elif privacy == "private":
-            query = query.filter(Profile.is_private.is_(True))
-        profiles = query.all()
+    # Only the rendered columns are selected and rows are streamed in batches,
+    # so no ORM objects are hydrated for what is a read-only listing.
+    stmt = select(
+        Profile.username,
+        Profile.is_private,
+        Profile.full_name,
+        Profile.followers,
+        Profile.last_checked,
+    ).execution_options(yield_per=500)
+    if privacy == "public":
+        stmt = stmt.where(Profile.is_private.is_(False))
+    elif privacy == "private":
+        stmt = stmt.where(Profile.is_private.is_(True))
 
     table = Table(title="Target Users (from Database)")
     table.add_column("Username", style="cyan")
@@ -57,61 +67,73 @@ def list_users(
     table.add_column("Followers", style="blue")
     table.add_column("Last Checked", style="yellow")
 
-    for profile in profiles:
-        user_type = "Private" if profile.is_private else "Public"
-        table.add_row(
-            profile.username,
-            user_type,
-            profile.full_name or "N/A",
-            str(profile.followers) if profile.followers is not None else "N/A",
-            str(profile.last_checked) if profile.last_checked else "N/A",
-        )
+    # Cells are plain Text, so Rich does not run its markup parser on every value.
+    with _get_db_session() as db:
+        for username, is_private, full_name, followers, last_checked in db.execute(stmt):
+            user_type = "Private" if is_private else "Public"
+            table.add_row(
+                Text(username),
+                Text(user_type),
+                Text(full_name or "N/A"),
+                Text(str(followers) if followers is not None else "N/A"),
+                Text(str(last_checked) if last_checked else "N/A"),
+            )
 
     console.print(table)
 
 
-@app.command(help="Add a new target user.")
+@app.command(help="Add one or more target users.")
 def add(
-    username: Annotated[
-        str,
-        typer.Argument(..., help="The Instagram username to add.", show_default=False),
+    usernames: Annotated[
+        list[str],
+        typer.Argument(..., help="The Instagram usernames to add.", show_default=False),
     ],
     private: bool = typer.Option(
         False,  # Default value
         "--private",
         "-p",
-        help="Flag to mark the user as a private profile.",
+        help="Flag to mark the users as private profiles.",
     ),
 ) -> None:
-    """Adds a user to the database."""
+    """Adds users to the database in a single transaction."""
+    usernames = list(dict.fromkeys(usernames))
     with _get_db_session() as db:
-        existing_profile = db.query(Profile).filter_by(username=username).first()
-        if existing_profile:
-            console.print(f"[bold yellow]Skipped:[/] User '[cyan]{username}[/]' already exists in the database.")
-            return
-
-        new_profile = Profile(username=username, is_private=private)
-        db.add(new_profile)
-        db.commit()
-        db.refresh(new_profile)
+        existing = set(db.scalars(select(Profile.username).where(Profile.username.in_(usernames))))
+        new_usernames = [username for username in usernames if username not in existing]
+        if new_usernames:
+            db.execute(insert(Profile), [{"username": username, "is_private": private} for username in new_usernames])
+            db.commit()
 
     user_type = "private" if private else "public"
-    console.print(f"[bold green]Success:[/] User '[cyan]{username}[/]' added to the database as a {user_type} profile.")
+    for username in usernames:
+        if username in existing:
+            console.print(f"[bold yellow]Skipped:[/] User '[cyan]{username}[/]' already exists in the database.")
+        else:
+            console.print(
+                f"[bold green]Success:[/] User '[cyan]{username}[/]' added to the database as a {user_type} profile."
+            )
 
 
-@app.command(help="Remove a target user.")
+@app.command(help="Remove one or more target users.")
 def remove(
-    username: Annotated[
-        str,
-        typer.Argument(..., help="The Instagram username to remove.", show_default=False),
+    usernames: Annotated[
+        list[str],
+        typer.Argument(..., help="The Instagram usernames to remove.", show_default=False),
     ],
 ) -> None:
-    """Removes a user from the database."""
+    """Removes users from the database in a single transaction."""
+    usernames = list(dict.fromkeys(usernames))
     with _get_db_session() as db:
-        profile_to_remove = db.query(Profile).filter_by(username=username).first()
-        if profile_to_remove:
-            db.delete(profile_to_remove)
+        # Profiles are deleted through the ORM so their hashtag/mention links go with them.
+        profiles_to_remove = db.scalars(select(Profile).where(Profile.username.in_(usernames))).all()
+        for profile in profiles_to_remove:
+            db.delete(profile)
+        if profiles_to_remove:
             db.commit()
+        removed = {profile.username for profile in profiles_to_remove}
+
+    for username in usernames:
+        if username in removed:
             console.print(f"[bold green]Success:[/] User '[cyan]{username}[/]' removed from the database.")
         else:
             console.print(f"[bold red]Error:[/] User '[cyan]{username}[/]' not found in the database.")
@@ -140,6 +162,11 @@ def clean(
         logger.exception("An error occurred during cleaning.")
 
 
+def _clean_before_download(days: int) -> None:
+    """Remove downloaded files older than the given number of days."""
+    FileManager().remove_old_files(cutoff_delta=timedelta(days=days))
+
+
 @app.command(help="Download Instagram profiles.")
 def download(
     privacy: Annotated[
@@ -165,22 +192,38 @@ def download(
             show_default=True,
         ),
     ] = 0,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Number of profiles downloaded concurrently (1 downloads them one by one).",
+            min=1,
+            show_default=True,
+        ),
+    ] = DOWNLOAD_WORKERS,
 ) -> None:
     """Downloads Instagram profiles based on privacy settings."""
+    # Imported here so the other commands do not pay for loading instaloader.
+    from src.core.instagram import Instagram  # noqa: PLC0415
+
     logger = setup_logging()
     try:
-        if clean_days > 0:
-            fm = FileManager()
-            fm.remove_old_files(cutoff_delta=timedelta(days=clean_days))
-            logger.info("Cleaned files older than %d days before download.", clean_days)
-
-        with get_session() as main_db_session:
-            instagram = Instagram(
-                db=main_db_session,
-                highlights=False,
-                privacy_filter=privacy,
-            )
-            instagram.run()
+        # The cleanup runs beside the Instagram setup and is awaited before any download starts.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="clean") as executor:
+            cleanup = executor.submit(_clean_before_download, clean_days) if clean_days > 0 else None
+
+            with get_session() as main_db_session:
+                instagram = Instagram(
+                    db=main_db_session,
+                    highlights=False,
+                    privacy_filter=privacy,
+                    workers=workers,
+                )
+                if cleanup:
+                    cleanup.result()
+                    logger.info("Cleaned files older than %d days before download.", clean_days)
+                instagram.run()
         logger.info("Instagram processing finished successfully.")
     except Exception:
         logger.exception("An error occurred during download.")
@@ -1,6 +1,22 @@
-from src.core import FileManager, Instagram, SessionLocal, get_session
+from typing import TYPE_CHECKING, Any
+
+from src.core import FileManager, SessionLocal, get_session
 from src.utils import setup_logging
 
+if TYPE_CHECKING:
+    from src.core.instagram import Instagram
+
+
+def __getattr__(name: str) -> Any:
+    """Import Instagram on first use, as instaloader is only needed for downloads."""
+    if name == "Instagram":
+        from src.core.instagram import Instagram  # noqa: PLC0415
+
+        return Instagram
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = [
     "FileManager",
     "Instagram",
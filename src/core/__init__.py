@@ -1,22 +1,30 @@
 from collections.abc import Iterator
 from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm import Session
 
 from src.core.db import Profile, SessionLocal, init_db
 from src.core.file_manager import FileManager
-from src.core.instagram import Instagram
 from src.utils.logger import setup_logging
 
+if TYPE_CHECKING:
+    from src.core.instagram import Instagram
+
 logger = setup_logging()
 
 
 @contextmanager
 def get_session() -> Iterator[Session]:
-    """Provide a transactional scope around a series of operations for the main loop."""
+    """Provide a transactional scope around a series of operations for the main loop.
+
+    The transaction is committed when the block exits cleanly, so the connection
+    goes back to the pool without pending work.
+    """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
     except Exception:
         logger.exception("Main processing session error occurred. Rolling back.")
         db.rollback()
@@ -25,4 +33,14 @@ def get_session() -> Iterator[Session]:
         db.close()
 
 
+def __getattr__(name: str) -> Any:
+    """Import Instagram on first use, as instaloader is only needed for downloads."""
+    if name == "Instagram":
+        from src.core.instagram import Instagram  # noqa: PLC0415
+
+        return Instagram
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = ["FileManager", "Instagram", "Profile", "SessionLocal", "get_session", "init_db"]
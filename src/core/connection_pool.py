@@ -0,0 +1,99 @@
+from instaloader import InstaloaderContext, instaloadercontext
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Media is fetched from Instagram's CDN with idempotent GET and HEAD requests,
+# so transient server errors are retried here. 429 is left to the rate controller.
+MEDIA_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pool outlives the sessions it is mounted on.
+
+    Instaloader opens a new anonymous session for every media download and
+    closes it right away, which would drop the connection and pay a new TLS
+    handshake per file. Closing such a session leaves this pool untouched;
+    :meth:`shutdown` releases it once all downloads are done.
+    """
+
+    def close(self) -> None:
+        """Keep pooled connections open when a session using the adapter closes."""
+
+    def shutdown(self) -> None:
+        """Close every pooled connection."""
+        super().close()
+
+
+_copy_session = instaloadercontext.copy_session
+
+
+def copy_session(session: Session, request_timeout: float | None = None) -> Session:
+    """Duplicate a session like instaloader does, keeping its hooks and keep-alive adapters.
+
+    Instaloader copies the logged-in session for every GraphQL and iPhone API
+    query, carrying over only its cookies and headers. The copy now also keeps
+    the response hooks and the pooled connections of the original.
+
+    Only copies made through this function, after :func:`install`, are covered.
+    Other sessions instaloader creates, such as the one swapped in by
+    ``InstaloaderContext.anonymous_copy()``, get the media pool from
+    :func:`reuse_connections` but none of the logged-in session's hooks. Their
+    responses therefore skip the rate-limit bookkeeping of
+    ``AdaptiveRateController`` and are decoded by the standard ``json`` module.
+
+    :param session: The session to duplicate.
+    :type session: Session
+    :param request_timeout: Timeout applied to every request of the copy.
+    :type request_timeout: float | None
+    :return: The new session.
+    :rtype: Session
+    """
+    new = _copy_session(session, request_timeout)
+    new.hooks = {event: list(hooks) for event, hooks in session.hooks.items()}
+    for prefix, adapter in session.adapters.items():
+        if isinstance(adapter, KeepAliveAdapter):
+            new.mount(prefix, adapter)
+    return new
+
+
+def install() -> None:
+    """Make instaloader duplicate its sessions with :func:`copy_session`.
+
+    Instaloader looks ``copy_session`` up in its own module for every query, so
+    the replacement applies to the whole process. Calling this again is a no-op.
+    """
+    if instaloadercontext.copy_session is not copy_session:
+        instaloadercontext.copy_session = copy_session
+
+
+def reuse_connections(
+    context: InstaloaderContext, media_adapter: KeepAliveAdapter, api_adapter: KeepAliveAdapter
+) -> None:
+    """Make the sessions of an Instaloader context draw from shared connection pools.
+
+    The per-query copies of the logged-in session only keep the API pool once
+    :func:`install` has been called.
+
+    :param context: The context whose requests should reuse connections.
+    :type context: InstaloaderContext
+    :param media_adapter: The adapter used by the anonymous sessions that download media.
+    :type media_adapter: KeepAliveAdapter
+    :param api_adapter: The adapter used by the logged-in session and its per-query copies.
+    :type api_adapter: KeepAliveAdapter
+    """
+    context._session.mount("https://", api_adapter)  # noqa: SLF001
+
+    new_session = context.get_anonymous_session
+
+    def get_anonymous_session() -> Session:
+        session = new_session()
+        session.mount("https://", media_adapter)
+        return session
+
+    context.get_anonymous_session = get_anonymous_session  # type: ignore[method-assign]
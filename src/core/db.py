@@ -1,6 +1,7 @@
 import os
 from collections.abc import Iterator
 from datetime import datetime
+from typing import Any
 
 from dotenv import load_dotenv
 from sqlalchemy import (
@@ -13,6 +14,8 @@ from sqlalchemy import (
     Table,
     Text,
     create_engine,
+    event,
+    make_url,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -31,8 +34,46 @@ if not DATABASE_URL:
     err = "DATABASE_URL environment variable is not set."
     raise ValueError(err)
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=memory",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Tune every new SQLite connection for concurrent reads and cheaper commits."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Server databases keep a pool of warm connections. Checkout is LIFO so the most
+# recently used connection is reused while idle ones age out past pool_recycle.
+# SQLite picks its own pool class, which does not take these arguments.
+POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+}
+
+if make_url(DATABASE_URL).get_backend_name() == "sqlite":
+    engine = create_engine(DATABASE_URL)
+    event.listen(engine, "connect", set_sqlite_pragmas)
+else:
+    engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
+
+# Objects stay loaded after a commit; the download run keeps using the profile,
+# hashtag and mention rows it has already read between its batch commits.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 class Base(DeclarativeBase):
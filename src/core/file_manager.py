@@ -1,16 +1,22 @@
 import concurrent.futures
 import logging
 import os
-from datetime import UTC, datetime, timedelta
+import time
+from collections import defaultdict
+from datetime import timedelta
 from functools import partial
 from pathlib import Path
 from typing import ClassVar, Literal
 
 from src.utils import DOWNLOAD_DIRECTORY, MAX_WORKERS
 
-FileStatus = Literal["removed", "failed", "skipped"]
+FileStatus = Literal["removed", "failed"]
 FileResult = tuple[FileStatus, Path]
 
+# unlinkat(2) lets a directory's files be removed through one open descriptor
+# instead of resolving every absolute path again.
+UNLINK_SUPPORTS_DIR_FD = os.unlink in os.supports_dir_fd
+
 
 class FileManager:
     """Manages files in a directory providing methods for retrieval and removal.
@@ -21,7 +27,7 @@ class FileManager:
     - Removing image files that don't meet minimum dimension requirements
     """
 
-    SUPPORTED_EXTENSIONS: ClassVar[set[str]] = {
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
         ".jpg",
         ".jpeg",
         ".png",
@@ -29,8 +35,8 @@ class FileManager:
         ".mpg",
         ".mp4",
         ".webp",
-    }
-    IMAGE_EXTENSIONS: ClassVar[set[str]] = {".jpg", ".jpeg", ".png", ".webp"}
+    })
+    IMAGE_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({".jpg", ".jpeg", ".png", ".webp"})
     LARGE_FILE_THRESHOLD: ClassVar[int] = 100_000
 
     def __init__(self) -> None:
@@ -54,77 +60,114 @@ class FileManager:
             cutoff_delta.days,
         )
 
-        removed_count = 0
-        failed_removals: list[Path] = []
+        cutoff = time.time() - cutoff_delta.total_seconds()
+        removed_count, failed_removals = self._bulk_unlink(self.media_files, cutoff)
+        self._log_removal_summary(removed_count, failed_removals)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            results = list(
-                executor.map(
-                    partial(self._process_old_file, cutoff_delta=cutoff_delta),
-                    self.media_files,
-                )
-            )
+    def _bulk_unlink(self, file_paths: list[Path], cutoff: float) -> tuple[int, list[Path]]:
+        """Remove the files modified before the cutoff, grouped by their parent directory.
 
-        for status, file_path in results:
-            if status == "removed":
-                removed_count += 1
-            elif status == "failed":
-                failed_removals.append(file_path)
+        Each directory is handled by one worker, which checks and removes all of
+        its files in a single pass.
 
-        self._log_removal_summary(removed_count, failed_removals)
+        :param file_paths: Candidate files.
+        :type file_paths: list[Path]
+        :param cutoff: Files last modified before this Unix timestamp are removed.
+        :type cutoff: float
+        :return: The number of removed files and the files that could not be removed.
+        :rtype: tuple[int, list[Path]]
+        """
+        by_directory: defaultdict[Path, list[str]] = defaultdict(list)
+        for file_path in file_paths:
+            by_directory[file_path.parent].append(file_path.name)
 
-    def _process_old_file(
-        self,
-        file_path: Path,
-        cutoff_delta: timedelta,
-    ) -> FileResult:
-        """Process a file to check if it should be removed based on age.
+        removed_count = 0
+        failed_removals: list[Path] = []
 
-        :param file_path: Path to the file to check.
-        :type file_path: Path
-        :param cutoff_delta: Time duration threshold.
-        :type cutoff_delta: timedelta
-        :return: Status of the operation and the file path.
-        :rtype: FileResult
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            unlink_expired = partial(self._unlink_in_directory, cutoff=cutoff)
+            for results in executor.map(unlink_expired, by_directory.keys(), by_directory.values()):
+                for status, file_path in results:
+                    if status == "removed":
+                        removed_count += 1
+                    elif status == "failed":
+                        failed_removals.append(file_path)
+
+        return removed_count, failed_removals
+
+    def _unlink_in_directory(self, directory: Path, names: list[str], cutoff: float) -> list[FileResult]:
+        """Remove the files of one directory that were modified before the cutoff.
+
+        Where the platform allows it, files are checked and removed relative to
+        a single directory descriptor instead of resolving every path again.
+
+        :param directory: Directory containing the files.
+        :type directory: Path
+        :param names: Names of the candidate files.
+        :type names: list[str]
+        :param cutoff: Files last modified before this Unix timestamp are removed.
+        :type cutoff: float
+        :return: Status of the operation for every expired file.
+        :rtype: list[FileResult]
         """
+        if not UNLINK_SUPPORTS_DIR_FD:
+            return [
+                ("removed" if self._remove_file(directory / name) else "failed", directory / name)
+                for name in names
+                if self._is_file_older_than(directory / name, cutoff)
+            ]
+
         try:
-            if self._is_file_older_than(file_path, cutoff_delta):
-                if self._remove_file(file_path):
-                    return ("removed", file_path)
-                return ("failed", file_path)
-        except (FileNotFoundError, PermissionError, OSError):
-            self.logger.exception("Error processing file %s", file_path)
-            return ("failed", file_path)
-        else:
-            return ("skipped", file_path)
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            self.logger.exception("Error opening directory %s", directory)
+            return [("failed", directory / name) for name in names]
+
+        results: list[FileResult] = []
+        try:
+            for name in names:
+                if not self._is_file_older_than(directory / name, cutoff, dir_fd=dir_fd):
+                    continue
+                try:
+                    os.unlink(name, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    self.logger.warning("File no longer exists: %s", directory / name)
+                    results.append(("removed", directory / name))
+                except OSError:
+                    self.logger.exception("Error removing file: %s", directory / name)
+                    results.append(("failed", directory / name))
+                else:
+                    results.append(("removed", directory / name))
+        finally:
+            os.close(dir_fd)
+        return results
 
     def _get_files(self) -> list[Path]:
         """Get all media files in the download directory and its subdirectories.
 
+        The tree is read with a single ``os.scandir`` pass per directory. The
+        entry type comes from the directory listing itself, so regular files
+        are classified without an extra ``stat`` call each.
+
         :return: List of Path objects for the media files found.
         :rtype: list[Path]
         """
-        media_files = []
-        problematic_files = []
+        media_files: list[Path] = []
+        problematic_files: list[str] = []
+        pending = [str(self.download_directory)]
 
-        for root, _, files in os.walk(self.download_directory):
-            root_path = Path(root)
-            for file in files:
+        while pending:
+            for entry in self._scan_directory(pending.pop()):
                 try:
-                    file_path = root_path / file
-                    suffix = Path(file).suffix.lower()
-                    if suffix in self.SUPPORTED_EXTENSIONS:
-                        try:
-                            _ = file_path.stat()
-                            media_files.append(file_path)
-                        except OSError:
-                            problematic_files.append(str(file_path))
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in self.SUPPORTED_EXTENSIONS:  # noqa: PTH122
+                        if entry.is_file():
+                            media_files.append(Path(entry.path))
+                        else:
+                            problematic_files.append(entry.path)
                 except OSError as e:
-                    self.logger.warning(
-                        "Error processing file '%s': %s",
-                        root_path / file,
-                        e,
-                    )
+                    self.logger.warning("Error processing file '%s': %s", entry.path, e)
 
         if problematic_files:
             self.logger.warning(
@@ -135,53 +178,44 @@ class FileManager:
         self.logger.debug("Found %d media files.", len(media_files))
         return media_files
 
-    def _is_file_older_than(
-        self,
-        file_path: Path,
-        time_delta: timedelta,
-    ) -> bool:
-        """Check if a file is older than the specified time.
+    def _scan_directory(self, directory: str) -> list[os.DirEntry[str]]:
+        """List the entries of a single directory.
+
+        :param directory: Path of the directory to list.
+        :type directory: str
+        :return: The directory entries, or an empty list if it cannot be read.
+        :rtype: list[os.DirEntry[str]]
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return list(entries)
+        except OSError as e:
+            self.logger.warning("Error scanning directory '%s': %s", directory, e)
+            return []
+
+    def _is_file_older_than(self, file_path: Path, cutoff: float, dir_fd: int | None = None) -> bool:
+        """Check if a file was last modified before the cutoff.
 
         :param file_path: Path to the file.
         :type file_path: Path
-        :param time_delta: Time duration to compare against.
-        :type time_delta: timedelta
-        :return: True if the file is older than the time delta.
+        :param cutoff: Unix timestamp to compare against.
+        :type cutoff: float
+        :param dir_fd: Descriptor of the file's directory, to look the file up by name only.
+        :type dir_fd: int | None
+        :return: True if the file is older than the cutoff.
         :rtype: bool
         """
         try:
-            cutoff_time = datetime.now(tz=UTC) - time_delta
-
-            try:
-                file_stat = file_path.stat()
-                if file_stat.st_mtime <= 0:
-                    self.logger.warning("Invalid modification time for file: %s", file_path)
-                    return False
-
-                file_mod_time = datetime.fromtimestamp(file_stat.st_mtime, tz=UTC)
-            except OSError:
-                try:
-                    file_stat = file_path.stat()
-                    if file_stat.st_mtime <= 0:
-                        self.logger.warning("Invalid modification time for file: %s", file_path)
-                        return False
-
-                    file_mod_time = datetime.fromtimestamp(file_stat.st_mtime, tz=UTC)
-                except (OSError, ValueError):
-                    self.logger.exception(
-                        "Error getting the modification date for '%s'",
-                        file_path,
-                    )
-                    return False
-                else:
-                    return file_mod_time < cutoff_time
-            else:
-                return file_mod_time < cutoff_time
-
-        except (OSError, ValueError):
+            mtime = os.stat(file_path if dir_fd is None else file_path.name, dir_fd=dir_fd).st_mtime
+        except OSError:
             self.logger.exception("Error getting the modification date for '%s'", file_path)
             return False
 
+        if mtime <= 0:
+            self.logger.warning("Invalid modification time for file: %s", file_path)
+            return False
+        return mtime < cutoff
+
     def _remove_file(self, file_path: Path) -> bool:
         """Remove a specific file safely.
 
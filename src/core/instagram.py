@@ -1,14 +1,21 @@
 import contextlib
+import functools
+import logging
 import os
 import sys
+import threading
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
 from platform import system
+from queue import Queue
 from sqlite3 import Connection, OperationalError, connect
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
+import orjson
 from instaloader import (
+    AbortDownloadException,
     ConnectionException,
     Instaloader,
     InstaloaderException,
@@ -16,6 +23,8 @@ from instaloader import (
     Profile,
     ProfileNotExistsException,
 )
+from requests import Response
+from requests.exceptions import JSONDecodeError
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -24,14 +33,107 @@ from tqdm import tqdm
 if TYPE_CHECKING:
     from sqlalchemy.sql.selectable import Select
 
+from src.core.connection_pool import MEDIA_RETRY, KeepAliveAdapter, install, reuse_connections
 from src.core.db import Hashtag, Mention
 from src.core.db import Profile as DbProfile
+from src.core.rate_controller import AdaptiveRateController, Backoff, QueryHistory
 from src.utils import (
+    BATCH_SIZE,
+    COOKIE_FILE_CACHE,
     DOWNLOAD_DIRECTORY,
+    DOWNLOAD_WORKERS,
     LATEST_STAMPS,
+    PROFILE_RECHECK_INTERVAL,
     setup_logging,
 )
 
+logger = logging.getLogger(__name__)
+
+# Instagram only sets cookies on these hosts, so an equality probe can use the
+# moz_cookies host index instead of scanning the table with a leading-wildcard LIKE.
+INSTAGRAM_COOKIE_HOSTS = (".instagram.com", "instagram.com", "www.instagram.com")
+COOKIES_QUERY = "SELECT name, value FROM moz_cookies WHERE host IN (?, ?, ?)"
+# The immutable snapshot is never written, so its pages can be read through mmap.
+COOKIES_PRAGMAS = "PRAGMA query_only=1; PRAGMA temp_store=memory; PRAGMA cache_size=-8000; PRAGMA mmap_size=268435456;"
+
+# Every download goes to a directory named after its profile, whichever worker fetches it.
+DIRNAME_PATTERN = str(DOWNLOAD_DIRECTORY / "{target}")
+
+FIREFOX_PROFILE_ROOTS = {
+    "Windows": "AppData/Roaming/Mozilla/Firefox/Profiles",
+    "Darwin": "Library/Application Support/Firefox/Profiles",
+    "Linux": ".mozilla/firefox",
+}
+# The platform cannot change while the process runs, so its profiles root is resolved once.
+FIREFOX_PROFILES_ROOT = FIREFOX_PROFILE_ROOTS.get(system(), FIREFOX_PROFILE_ROOTS["Linux"])
+
+
+def _orjson_body(response: Response, **kwargs: Any) -> Any:
+    """Decode a response body with orjson, failing the way ``Response.json`` does.
+
+    :param response: The response whose body is decoded.
+    :type response: Response
+    :param kwargs: Options for ``json.loads``; when given, the standard decoder is used instead.
+    :type kwargs: Any
+    :raises JSONDecodeError: If the body is not valid JSON.
+    :return: The decoded body.
+    :rtype: Any
+    """
+    if kwargs:
+        return Response.json(response, **kwargs)
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def _json_with_orjson(response: Response, *_args: Any, **_kwargs: Any) -> None:
+    """Response hook making ``response.json()`` parse the raw body with orjson.
+
+    orjson reads the bytes directly, skipping the text decoding pass.
+    """
+    response.json = functools.partial(_orjson_body, response)  # type: ignore[method-assign]
+
+
+class _BufferedLatestStamps(LatestStamps):
+    """LatestStamps variant that keeps updates in memory until flushed.
+
+    Instaloader rewrites the whole ini file after every stamp update; here the
+    setters only mark the data as dirty and :meth:`flush` writes it once.
+    Updates are serialized so all download workers can share one instance.
+    """
+
+    def __init__(self, latest_stamps_file: str | Path) -> None:
+        super().__init__(latest_stamps_file)  # type: ignore[no-untyped-call]
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def _save(self) -> None:
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending updates to the latest stamps file, if there are any."""
+        with self._lock:
+            if self._dirty:
+                super()._save()  # type: ignore[no-untyped-call]
+                self._dirty = False
+
+    def _set_timestamp(self, section: str, key: str, timestamp: datetime) -> None:
+        with self._lock:
+            super()._set_timestamp(section, key, timestamp)  # type: ignore[no-untyped-call]
+
+    def save_profile_id(self, profile_name: str, profile_id: int) -> None:
+        with self._lock:
+            super().save_profile_id(profile_name, profile_id)  # type: ignore[no-untyped-call]
+
+    def rename_profile(self, old_profile: str, new_profile: str) -> None:
+        with self._lock:
+            super().rename_profile(old_profile, new_profile)  # type: ignore[no-untyped-call]
+
+    def set_profile_pic(self, profile_name: str, profile_pic: str) -> None:
+        with self._lock:
+            super().set_profile_pic(profile_name, profile_pic)  # type: ignore[no-untyped-call]
+
 
 class Instagram:
     """Manages Instagram downloads and session handling.
@@ -40,6 +142,9 @@ class Instagram:
     and managing login sessions via Firefox cookies.
     """
 
+    # Cookie database found earlier in this process; a failed lookup is not remembered.
+    _cookie_file: ClassVar[str | None] = None
+
     @staticmethod
     @contextlib.contextmanager
     def _suppress_output() -> Generator[None, Any]:
@@ -61,6 +166,7 @@ class Instagram:
         *,
         highlights: bool = False,
         privacy_filter: str = "all",
+        workers: int = DOWNLOAD_WORKERS,
     ) -> None:
         """Initialize the class with settings, configurations, and DB session.
 
@@ -72,6 +178,8 @@ class Instagram:
         :type highlights: bool
         :param privacy_filter: Filter profiles by privacy type ("public", "private", "all").
         :type privacy_filter: str
+        :param workers: Number of profiles downloaded concurrently; 1 downloads them one by one.
+        :type workers: int
         """
         self.logger = setup_logging()
         self.db = db
@@ -79,92 +187,251 @@ class Instagram:
         self.logger.info("Starting main Instagram processing...")
 
         if users is not None:
-            self.users = users
+            # Instagram usernames are case-insensitive, so variants of one name are fetched only once.
+            self.users = {user.strip().lower() for user in users if user.strip()}
             self.logger.info("Using explicitly provided list of %d users.", len(self.users))
         else:
-            # Fetch users from the database
-            query = self.db.query(DbProfile)
+            # Fetch usernames only; the full profiles are reloaded when upserted
+            stmt = select(DbProfile.username).execution_options(yield_per=1000)
             if privacy_filter == "public":
-                query = query.filter(DbProfile.is_private.is_(False))
+                stmt = stmt.where(DbProfile.is_private.is_(False))
             elif privacy_filter == "private":
-                query = query.filter(DbProfile.is_private.is_(True))
-            db_profiles = query.all()
-            self.users = {profile.username for profile in db_profiles}
+                stmt = stmt.where(DbProfile.is_private.is_(True))
+            self.users = set(self.db.scalars(stmt))
             self.logger.info(
                 "Fetched %d users from the database with privacy filter '%s'.",
                 len(self.users),
                 privacy_filter,
             )
 
+        self._skip_unreachable_profiles()
+
         self.highlights = highlights
-        self.latest_stamps = LatestStamps(LATEST_STAMPS)  # type: ignore[no-untyped-call]
+        self.latest_stamps = _BufferedLatestStamps(LATEST_STAMPS)
+        self._db_lock = threading.Lock()
+        self._aborted = threading.Event()
+        self._item_cache: dict[tuple[type, str], Any] = {}
+        self._pending_upserts = 0
 
         if not (cookie_file := self._get_cookie_file()):
             err = "No Firefox cookies.sqlite file found."
             raise SystemExit(err)
 
-        self.conn: Connection = connect(f"file:{cookie_file}?immutable=1", uri=True)
+        # Firefox may hold the cookie database open, so read it as an immutable
+        # snapshot: no locking, no journal/WAL probing and no change detection.
+        self.conn: Connection = connect(
+            f"file:{cookie_file}?mode=ro&immutable=1&nolock=1&cache=private",
+            uri=True,
+        )
+        self.conn.executescript(COOKIES_PRAGMAS)
+
+        # Instaloader is not thread-safe, so every download worker borrows its own instance.
+        # All of them share one backoff and query history, as Instagram rate-limits the account,
+        # not the connection.
+        self.backoff = Backoff()
+        self.query_history = QueryHistory()
+        # All workers draw from the same keep-alive pools: one for media downloads,
+        # one for API queries, which instaloader already retries by itself.
+        self.http_adapter = KeepAliveAdapter(
+            pool_connections=workers, pool_maxsize=workers * 2, max_retries=MEDIA_RETRY
+        )
+        self.api_adapter = KeepAliveAdapter(pool_connections=workers, pool_maxsize=workers)
+        install()
+        self.loaders = [self._create_loader() for _ in range(max(1, workers))]
+        self.loader = self.loaders[0]
+        self._idle_loaders: Queue[Instaloader] = Queue()
+        for loader in self.loaders:
+            self._idle_loaders.put(loader)
+
+    def _skip_unreachable_profiles(self) -> None:
+        """Leave out private profiles that were recently found inaccessible.
+
+        Nothing can be downloaded from a private profile the account does not
+        follow, so looking it up again within ``PROFILE_RECHECK_INTERVAL`` would
+        only spend rate-limit budget. Its database row is kept as it is.
+        """
+        stmt = select(DbProfile.username).where(
+            DbProfile.is_private.is_(True),
+            DbProfile.followed_by_viewer.is_not(True),
+            DbProfile.last_checked >= datetime.now(UTC) - PROFILE_RECHECK_INTERVAL,
+        )
+        if skipped := self.users.intersection(self.db.scalars(stmt)):
+            self.users = self.users.difference(skipped)
+            self.logger.info(
+                "Skipping %d private profiles checked in the last %s.", len(skipped), PROFILE_RECHECK_INTERVAL
+            )
 
-        self.loader = Instaloader(
+    def _create_loader(self) -> Instaloader:
+        """Create an Instaloader instance with the project's download settings."""
+        loader = Instaloader(
             quiet=True,
+            dirname_pattern=DIRNAME_PATTERN,
             filename_pattern="{profile}_{date_utc}_UTC",
             title_pattern="{profile}_{date_utc}_UTC",
             save_metadata=False,
             post_metadata_txt_pattern="",
-            fatal_status_codes=[400, 429],
+            # A 429 is retried once the shared backoff has elapsed, so only a 400 ends the run.
+            fatal_status_codes=[400],
+            rate_controller=functools.partial(AdaptiveRateController, backoff=self.backoff, history=self.query_history),
         )
+        loader.context._session.hooks["response"].append(_json_with_orjson)  # noqa: SLF001
+        reuse_connections(loader.context, self.http_adapter, self.api_adapter)
+        return loader
 
     def run(self) -> None:
         """Execute the main sequence of operations for the class."""
         self._import_session()
-        self._download()
-
-        if hasattr(self, "conn") and self.conn:
-            self.conn.close()
-            self.logger.debug("Closed connection to cookie database.")
+        try:
+            self._download()
+        finally:
+            self.latest_stamps.flush()
+            self.http_adapter.shutdown()
+            self.api_adapter.shutdown()
 
     def _download(self) -> None:
-        """Download Instagram profiles and their content, updating the database."""
-        self.logger.info("Starting download process for %d users", len(self.users))
+        """Download Instagram profiles and their content, updating the database.
+
+        Users are processed concurrently by up to ``workers`` threads,
+        each one holding its own Instaloader instance.
+        """
+        self.logger.info(
+            "Starting download process for %d users with %d workers",
+            len(self.users),
+            len(self.loaders),
+        )
+
+        progress_bar = tqdm(total=len(self.users), desc="Downloading profiles", unit="profile", leave=True)
 
-        progress_bar = tqdm(sorted(self.users), desc="Downloading profiles", unit="profile", leave=True)
+        story_userids: list[int] = []
 
-        for user in progress_bar:
-            progress_bar.set_postfix(user=user)
+        # Output is suppressed once around the pool: redirect_stdout swaps a
+        # process-wide global and is not safe to nest from several threads.
+        try:
+            with (
+                Instagram._suppress_output(),
+                ThreadPoolExecutor(max_workers=len(self.loaders), thread_name_prefix="download") as executor,
+            ):
+                futures = {executor.submit(self._process_user, user): user for user in sorted(self.users)}
+                try:
+                    for future in as_completed(futures):
+                        user = futures[future]
+                        progress_bar.set_postfix(user=user)
+                        progress_bar.update()
+                        try:
+                            userid = future.result()
+                        except AbortDownloadException:
+                            raise
+                        except Exception:
+                            # One failing profile must not stop the others.
+                            self.logger.exception("Unexpected error processing user '%s'", user)
+                            continue
+                        if userid is not None:
+                            story_userids.append(userid)
+                except BaseException:
+                    # Instagram refused the account outright, or the run was interrupted:
+                    # drop the queued users instead of sending more queries for them.
+                    self._aborted.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            progress_bar.close()
+            # Profiles saved before an abort are kept, whatever the caller does next.
+            with self._db_lock:
+                self._commit_in_batches(force=True)
+
+        if story_userids:
+            with Instagram._suppress_output():
+                self._download_stories(story_userids)
+
+    def _process_user(self, user: str) -> int | None:
+        """Fetch, persist and download a single user with a borrowed Instaloader.
+
+        :param user: The Instagram username to process.
+        :type user: str
+        :return: The user ID if the profile's stories should be downloaded, otherwise None.
+        :rtype: int | None
+        :raises AbortDownloadException: If Instagram answered with a fatal status code.
+        """
+        if self._aborted.is_set():
+            return None
 
-            try:
-                profile = self._get_instagram_profile(user)
-                if not profile:
-                    continue
+        loader = self._idle_loaders.get()
+        try:
+            # The lookup stays on the worker that downloads the profile: a Profile keeps
+            # using the context that fetched it, so prefetching on another loader would
+            # share one Instaloader session across threads.
+            profile = self._get_instagram_profile(user, loader)
+            if not profile:
+                return None
 
+            with self._db_lock:
                 db_profile = self._upsert_profile_to_db(profile)
-                if not db_profile:
-                    self.logger.error("Failed to save profile '%s' to database.", user)
-                    continue
-
-                self.loader.dirname_pattern = str(DOWNLOAD_DIRECTORY / user)
-
-                if db_profile.is_private and not profile.followed_by_viewer:
-                    continue
-
-                with Instagram._suppress_output():
-                    self._download_profile_content(profile)
-            except (
-                ProfileNotExistsException,
-                ConnectionException,
-                KeyError,
-                PermissionError,
-            ):
-                self.logger.exception("Error processing user '%s'", user)
-            finally:
-                pass
+                if db_profile:
+                    self._commit_in_batches()
+            if not db_profile:
+                self.logger.error("Failed to save profile '%s' to database.", user)
+                return None
+
+            if profile.is_private and not profile.followed_by_viewer:
+                return None
+
+            self._download_profile_content(profile, loader)
+        except AbortDownloadException:
+            # Set before the exception reaches the pool, so no worker starts another user.
+            self._aborted.set()
+            raise
+        except (
+            ProfileNotExistsException,
+            ConnectionException,
+            KeyError,
+            PermissionError,
+        ):
+            self.logger.exception("Error processing user '%s'", user)
+            return None
+        else:
+            return profile.userid
+        finally:
+            self._idle_loaders.put(loader)
+
+    def _commit_in_batches(self, *, force: bool = False) -> None:
+        """Commit profile upserts once ``BATCH_SIZE`` of them are pending.
+
+        Must be called while holding the database lock.
+
+        :param force: Commit whatever is pending, regardless of the batch size.
+        :type force: bool
+        """
+        if not force:
+            self._pending_upserts += 1
+            if self._pending_upserts < BATCH_SIZE:
+                return
+        if not self._pending_upserts:
+            return
+
+        try:
+            self.db.commit()
+        except SQLAlchemyError:
+            self.logger.exception("Database error committing %d profiles", self._pending_upserts)
+            self.db.rollback()
+            self._item_cache.clear()
+        self._pending_upserts = 0
 
     def _get_or_create_item(self, item_text: str, model_class: type, field_name: str) -> Any:
+        """Return the hashtag or mention for ``item_text``, creating it if needed.
+
+        Rows are remembered for the rest of the run, so a tag or mention shared
+        by several biographies is only looked up in the database once.
+        """
+        key = (model_class, item_text)
+        if (item := self._item_cache.get(key)) is not None:
+            return item
+
         stmt: Select[tuple[Any]] = select(model_class).where(item_text == getattr(model_class, field_name))
         item = self.db.scalars(stmt).one_or_none()
         if not item:
             item = model_class(**{field_name: item_text})
             self.db.add(item)
+        self._item_cache[key] = item
         return item
 
     def _upsert_profile_to_db(self, profile: Profile) -> DbProfile | None:
@@ -173,90 +440,119 @@ class Instagram:
         self.logger.debug("Upserting profile '%s' to database.", username)
 
         try:
-            stmt = select(DbProfile).where(DbProfile.username == username)
-            db_profile = self.db.scalars(stmt).one_or_none()
-
-            profile_data = {
-                "full_name": profile.full_name,
-                "biography": profile.biography,
-                "followers": profile.followers,
-                "followees": profile.followees,
-                "post_count": profile.mediacount,
-                "business_category_name": profile.business_category_name,
-                "external_url": profile.external_url,
-                "is_private": profile.is_private,
-                "blocked_by_viewer": profile.blocked_by_viewer,
-                "followed_by_viewer": profile.followed_by_viewer,
-                "follows_viewer": profile.follows_viewer,
-                "last_checked": datetime.now(UTC),
-            }
-
-            hashtags = []
-            if profile.biography_hashtags:
-                for tag_text in profile.biography_hashtags:
-                    hashtag = self._get_or_create_item(tag_text, Hashtag, "tag")
-                    hashtags.append(hashtag)
-
-            mentions = []
-            if profile.biography_mentions:
-                for mention_username in profile.biography_mentions:
-                    mention = self._get_or_create_item(mention_username, Mention, "username")
-                    mentions.append(mention)
-
-            if db_profile:
-                self.logger.debug("Updating existing DB profile for '%s'.", username)
-                for key, value in profile_data.items():
-                    setattr(db_profile, key, value)
-                db_profile.hashtags = hashtags
-                db_profile.mentions = mentions
-            else:
-                self.logger.debug("Creating new DB profile for '%s'.", username)
-                db_profile = DbProfile(username=username, **profile_data)
-                db_profile.hashtags = hashtags
-                db_profile.mentions = mentions
-                self.db.add(db_profile)
-
-            self.logger.debug("Committed changes for profile '%s'.", username)
+            # A savepoint, so a failure only discards this profile and not the
+            # upserts still waiting for the next batch commit.
+            with self.db.begin_nested():
+                stmt = select(DbProfile).where(DbProfile.username == username)
+                db_profile = self.db.scalars(stmt).one_or_none()
+
+                profile_data = {
+                    "full_name": profile.full_name,
+                    "biography": profile.biography,
+                    "followers": profile.followers,
+                    "followees": profile.followees,
+                    "post_count": profile.mediacount,
+                    "business_category_name": profile.business_category_name,
+                    "external_url": profile.external_url,
+                    "is_private": profile.is_private,
+                    "blocked_by_viewer": profile.blocked_by_viewer,
+                    "followed_by_viewer": profile.followed_by_viewer,
+                    "follows_viewer": profile.follows_viewer,
+                    "last_checked": datetime.now(UTC),
+                }
+
+                hashtags = []
+                if profile.biography_hashtags:
+                    for tag_text in profile.biography_hashtags:
+                        hashtag = self._get_or_create_item(tag_text, Hashtag, "tag")
+                        hashtags.append(hashtag)
+
+                mentions = []
+                if profile.biography_mentions:
+                    for mention_username in profile.biography_mentions:
+                        mention = self._get_or_create_item(mention_username, Mention, "username")
+                        mentions.append(mention)
+
+                if db_profile:
+                    self.logger.debug("Updating existing DB profile for '%s'.", username)
+                    for key, value in profile_data.items():
+                        setattr(db_profile, key, value)
+                    db_profile.hashtags = hashtags
+                    db_profile.mentions = mentions
+                else:
+                    self.logger.debug("Creating new DB profile for '%s'.", username)
+                    db_profile = DbProfile(username=username, **profile_data)
+                    db_profile.hashtags = hashtags
+                    db_profile.mentions = mentions
+                    self.db.add(db_profile)
+
+            self.logger.debug("Staged changes for profile '%s' for the next batch commit.", username)
 
         except SQLAlchemyError:
             self.logger.exception(
                 "Database error upserting profile '%s'",
                 username,
             )
-            self.db.rollback()
+            self._item_cache.clear()
             return None
         else:
             return db_profile
 
-    def _download_profile_content(self, profile: Profile) -> None:
-        """Download profile content including posts, stories, and highlights.
+    def _download_profile_content(self, profile: Profile, loader: Instaloader) -> None:
+        """Download profile content including posts, reels, and highlights.
+
+        Stories are left out; they are fetched for all profiles at once by
+        :meth:`_download_stories`.
 
         :param profile: Instagram profile to download.
         :type profile: Profile
+        :param loader: The Instaloader instance owned by the current worker.
+        :type loader: Instaloader
         """
         self.logger.debug("Downloading content for profile '%s'.", profile.username)
         try:
-            self.loader.download_profiles(
+            loader.download_profiles(
                 {profile},
                 tagged=False,
-                stories=True,
+                stories=False,
                 reels=True,
                 latest_stamps=self.latest_stamps,
             )
             if self.highlights:
-                self._download_profile_highlights(profile)
+                self._download_profile_highlights(profile, loader)
         except (KeyError, PermissionError):
             self.logger.exception("Error downloading content for profile '%s'", profile.username)
 
-    def _download_profile_highlights(self, profile: Profile) -> None:
+    def _download_stories(self, userids: list[int]) -> None:
+        """Download the stories of several profiles in batched requests.
+
+        Instaloader asks for the story reels of up to 50 users per GraphQL query,
+        instead of one query per profile when stories are fetched along with it.
+
+        :param userids: IDs of the profiles whose stories are downloaded.
+        :type userids: list[int]
+        """
+        self.logger.debug("Downloading stories for %d profiles.", len(userids))
+        try:
+            self.loader.download_stories(
+                userids=userids,
+                filename_target=None,
+                latest_stamps=self.latest_stamps,
+            )
+        except (InstaloaderException, KeyError, PermissionError):
+            self.logger.exception("Error downloading stories")
+
+    def _download_profile_highlights(self, profile: Profile, loader: Instaloader) -> None:
         """Download profile highlights if enabled.
 
         :param profile: Instagram profile to download highlights from.
         :type profile: Profile
+        :param loader: The Instaloader instance owned by the current worker.
+        :type loader: Instaloader
         """
         self.logger.debug("Downloading highlights for profile '%s'.", profile.username)
         try:
-            self.loader.download_highlights(profile, fast_update=True, filename_target=None)
+            loader.download_highlights(profile, fast_update=True, filename_target=profile.username)
         except (KeyError, ConnectionException, AssertionError):
             self.logger.exception(
                 "Error downloading highlights for profile '%s'",
@@ -264,7 +560,10 @@ class Instagram:
             )
 
     def _fetch_and_load_cookies(self) -> dict[str, str] | None:
-        """Fetch Instagram cookies from Firefox and load them into Instaloader.
+        """Fetch Instagram cookies from Firefox and load them into every Instaloader.
+
+        The rows are materialized in a single ``fetchall`` and the cookie database
+        is closed right away, since nothing reads it after the session import.
 
         :raises OperationalError: If there's an error, read the cookie database.
         :return: A dictionary of cookies if found, otherwise None.
@@ -272,13 +571,15 @@ class Instagram:
         """
         self.logger.debug("Fetching Instagram cookies from Firefox.")
         try:
-            cookie_data = self.conn.execute("SELECT name, value FROM moz_cookies WHERE host LIKE '%instagram.com'")
-            cookies = dict(cookie_data.fetchall())
+            with contextlib.closing(self.conn):
+                cookies = dict(self.conn.execute(COOKIES_QUERY, INSTAGRAM_COOKIE_HOSTS).fetchall())
+            self.logger.debug("Closed connection to cookie database.")
             if not cookies:
                 self.logger.warning("No Instagram cookies found in the Firefox cookie database.")
                 return None
 
-            self.loader.context.update_cookies(cookies)  # type: ignore[no-untyped-call]
+            for loader in self.loaders:
+                loader.context.update_cookies(cookies)  # type: ignore[no-untyped-call]
         except OperationalError:
             self.logger.exception("Error reading Firefox cookie database")
         else:
@@ -297,7 +598,8 @@ class Instagram:
                 sys.exit()
 
             self.logger.info("Session valid for '%s'", username)
-            self.loader.context.username = username  # type: ignore[assignment]
+            for loader in self.loaders:
+                loader.context.username = username  # type: ignore[assignment]
         except InstaloaderException:
             self.logger.exception("Instaloader error during login test")
 
@@ -317,17 +619,19 @@ class Instagram:
             self.logger.exception("Error during session import.")
             sys.exit("Failed to import session.")
 
-    def _get_instagram_profile(self, username: str) -> Profile | None:
+    def _get_instagram_profile(self, username: str, loader: Instaloader) -> Profile | None:
         """Retrieve the Instaloader profile object for a given user.
 
         :param username: The Instagram username to retrieve the profile from.
         :type username: str
+        :param loader: The Instaloader instance whose context performs the request.
+        :type loader: Instaloader
         :return: The Instaloader Profile object if found, otherwise None.
         :rtype: Profile | None
         """
         self.logger.debug("Attempting to fetch Instaloader profile for '%s'.", username)
         try:
-            profile = Profile.from_username(self.loader.context, username)
+            profile = Profile.from_username(loader.context, username)
             if not hasattr(profile, "userid"):
                 self.logger.warning("Fetched profile for '%s' seems incomplete.", username)
                 return None
@@ -343,23 +647,44 @@ class Instagram:
             self.logger.exception("Unexpected error retrieving profile '%s'.", username)
         return None
 
-    def _get_cookie_file(self) -> str | None:
-        """Retrieve the path to the Firefox cookies file based on the system.
+    @classmethod
+    def _get_cookie_file(cls) -> str | None:
+        """Retrieve the path to the Firefox cookies file, memoized once it is found.
+
+        A missing cookie database is looked for again on the next call, so a
+        Firefox profile created while the process runs is still picked up.
 
         :return: The path to the Firefox cookies file or None if not found.
         :rtype: str | None
         """
-        default_patterns = {
-            "Windows": "AppData/Roaming/Mozilla/Firefox/Profiles/*/cookies.sqlite",
-            "Darwin": "Library/Application Support/Firefox/Profiles/*/cookies.sqlite",
-            "Linux": ".mozilla/firefox/*/cookies.sqlite",
-        }
+        if cls._cookie_file is None:
+            cls._cookie_file = cls._find_cookie_file()
+        return cls._cookie_file
 
-        pattern = default_patterns.get(system(), ".mozilla/firefox/*/cookies.sqlite")
+    @staticmethod
+    def _find_cookie_file() -> str | None:
+        """Look up the Firefox cookies file based on the system.
+
+        The path found by the last run is remembered in ``COOKIE_FILE_CACHE`` and
+        reused while the file still exists. Otherwise, only the profiles root is
+        listed, stopping at the first profile that has a cookie database.
+
+        :return: The path to the Firefox cookies file or None if not found.
+        :rtype: str | None
+        """
+        with contextlib.suppress(OSError):
+            cached = COOKIE_FILE_CACHE.read_text(encoding="utf-8").strip()
+            if cached and Path(cached).is_file():
+                return cached
+
+        profiles_root = Path.home() / FIREFOX_PROFILES_ROOT
         try:
-            cookie_paths = list(Path.home().glob(pattern))
-            if cookie_paths:
-                return str(cookie_paths[0])
+            cookie_file = next((str(path) for path in profiles_root.glob("*/cookies.sqlite")), None)
         except (PermissionError, OSError):
-            self.logger.exception("Error accessing cookie file")
-        return None
+            logger.exception("Error accessing cookie file")
+            return None
+
+        if cookie_file:
+            with contextlib.suppress(OSError):
+                COOKIE_FILE_CACHE.write_text(cookie_file, encoding="utf-8")
+        return cookie_file
@@ -0,0 +1,194 @@
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
+
+from instaloader import InstaloaderContext, RateController
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# Hosts of the GraphQL and API queries that Instagram rate-limits.
+API_HOSTS = frozenset({"www.instagram.com", "i.instagram.com"})
+
+
+class Backoff:
+    """Server-requested wait shared by every rate controller of a download pool.
+
+    When Instagram asks one worker to slow down, all workers sharing the same
+    instance honour it, since the limit applies to the account rather than to
+    a single connection.
+    """
+
+    BASE: ClassVar[float] = 30.0
+    CAP: ClassVar[float] = 15 * 60.0
+
+    def __init__(self) -> None:
+        """Initialize the backoff with no pending wait."""
+        self._lock = threading.Lock()
+        self._wait_until = 0.0
+        self._consecutive_429 = 0
+
+    def push_back(self, delay: float) -> None:
+        """Delay the next query by at least ``delay`` seconds from now.
+
+        :param delay: Seconds to wait.
+        :type delay: float
+        """
+        with self._lock:
+            self._wait_until = max(self._wait_until, time.monotonic() + delay)
+
+    def record_429(self) -> None:
+        """Back off exponentially for each consecutive 429 response."""
+        with self._lock:
+            self._consecutive_429 += 1
+            delay = min(self.BASE * 2 ** (self._consecutive_429 - 1), self.CAP)
+            self._wait_until = max(self._wait_until, time.monotonic() + delay)
+
+    def reset_429(self, current_time: float) -> None:
+        """Reset the exponential backoff once a query succeeds after the backoff has elapsed.
+
+        Successes of queries sent before the deadline, by other workers, do not
+        count: they would keep the backoff from ever growing past its base.
+
+        :param current_time: A ``time.monotonic`` value.
+        :type current_time: float
+        """
+        with self._lock:
+            if current_time >= self._wait_until:
+                self._consecutive_429 = 0
+
+    def remaining(self, current_time: float) -> float:
+        """Return how long to wait from ``current_time`` (a ``time.monotonic`` value)."""
+        return self._wait_until - current_time
+
+
+class QueryHistory:
+    """Query timestamps shared by every rate controller of a download pool.
+
+    Instaloader budgets queries over sliding windows of each controller's own
+    history. Sharing it makes the whole pool stay within the budget of a single
+    account, instead of each worker spending that budget on its own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self.lock = threading.RLock()
+        self.timestamps: dict[str, list[float]] = {}
+
+
+class AdaptiveRateController(RateController):
+    """RateController that also honours the rate-limit hints sent by Instagram.
+
+    Every response is inspected through a ``requests`` hook. A ``Retry-After``
+    header, or an exhausted ``X-RateLimit-Remaining`` budget, pushes back the
+    earliest time the next query may be sent. Consecutive 429 responses back
+    off exponentially on top of instaloader's sliding-window estimate.
+    """
+
+    def __init__(
+        self,
+        context: InstaloaderContext,
+        backoff: Backoff | None = None,
+        history: QueryHistory | None = None,
+    ) -> None:
+        """Initialize the controller and start listening to the context's responses.
+
+        :param context: The Instaloader context whose queries are rate-limited.
+        :type context: InstaloaderContext
+        :param backoff: Backoff shared with other controllers; a private one if omitted.
+        :type backoff: Backoff | None
+        :param history: Query history shared with other controllers; a private one if omitted.
+        :type history: QueryHistory | None
+        """
+        super().__init__(context)
+        self._backoff = backoff or Backoff()
+        self._history = history or QueryHistory()
+        self._query_timestamps = self._history.timestamps
+        context._session.hooks["response"].append(self._record_response)  # noqa: SLF001
+
+    def _record_response(self, response: Response, *_args: Any, **_kwargs: Any) -> None:
+        """Record the rate-limit headers of a response.
+
+        :param response: The response received from Instagram.
+        :type response: Response
+        """
+        if response.status_code == HTTPStatus.OK and urlsplit(response.url).hostname in API_HOSTS:
+            self._backoff.reset_429(time.monotonic())
+
+        delay = self._retry_after(response.headers)
+        if delay is None and response.headers.get("X-RateLimit-Remaining") == "0":
+            delay = Backoff.BASE
+        if delay is not None:
+            self._backoff.push_back(delay)
+
+    @staticmethod
+    def _retry_after(headers: CaseInsensitiveDict[str]) -> float | None:
+        """Parse the ``Retry-After`` header, given either in seconds or as an HTTP date.
+
+        :param headers: The response headers.
+        :type headers: CaseInsensitiveDict[str]
+        :return: Seconds to wait, or None if the header is missing or malformed.
+        :rtype: float | None
+        """
+        if (value := headers.get("Retry-After")) is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # A "-0000" zone parses as naive; HTTP dates are always in UTC.
+            retry_at = retry_at.replace(tzinfo=UTC)
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+    def sleep(self, secs: float) -> None:
+        """Sleep until a deadline, extended if the shared backoff moves while waiting.
+
+        :param secs: Seconds to wait, as computed by :meth:`query_waittime`.
+        :type secs: float
+        """
+        deadline = time.monotonic() + secs
+        while True:
+            current_time = time.monotonic()
+            waittime = max(deadline - current_time, self._backoff.remaining(current_time))
+            if waittime <= 0:
+                return
+            time.sleep(waittime)
+
+    def query_waittime(self, query_type: str, current_time: float, untracked_queries: bool = False) -> float:  # noqa: FBT002
+        """Calculate the wait before a query, never earlier than the server asked for."""
+        with self._history.lock:
+            waittime = super().query_waittime(query_type, current_time, untracked_queries)
+        return max(waittime, self._backoff.remaining(current_time))
+
+    def wait_before_query(self, query_type: str) -> None:
+        """Wait until the shared budget has room for a query, then reserve it.
+
+        The check and the reservation happen under the history lock, so two
+        workers cannot both take the last slot of a window; the sleep does not.
+        """
+        while True:
+            with self._history.lock:
+                current_time = time.monotonic()
+                waittime = self.query_waittime(query_type, current_time)
+                if waittime <= 0:
+                    self._query_timestamps.setdefault(query_type, []).append(current_time)
+                    return
+            self.sleep(waittime)
+
+    def _dump_query_timestamps(self, current_time: float, failed_query_type: str) -> None:
+        """Report the per-window query counts without racing other workers."""
+        with self._history.lock:
+            super()._dump_query_timestamps(current_time, failed_query_type)
+
+    def handle_429(self, query_type: str) -> None:
+        """Back off exponentially on repeated 429 responses before retrying."""
+        self._backoff.record_429()
+        super().handle_429(query_type)
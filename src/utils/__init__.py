@@ -1,10 +1,14 @@
 from src.utils.import_users import UserImporter
 from src.utils.logger import root, setup_logging
 from src.utils.settings import (
+    BATCH_SIZE,
+    COOKIE_FILE_CACHE,
     DOWNLOAD_DIRECTORY,
+    DOWNLOAD_WORKERS,
     LATEST_STAMPS,
     LOG_DIRECTORY,
     MAX_WORKERS,
+    PROFILE_RECHECK_INTERVAL,
     RESOURCES_DIRECTORY,
 )
 from src.utils.startup_tasks import run_startup_tasks
@@ -12,10 +16,14 @@ from src.utils.startup_tasks import run_startup_tasks
 run_startup_tasks()
 
 __all__ = [
+    "BATCH_SIZE",
+    "COOKIE_FILE_CACHE",
     "DOWNLOAD_DIRECTORY",
+    "DOWNLOAD_WORKERS",
     "LATEST_STAMPS",
     "LOG_DIRECTORY",
     "MAX_WORKERS",
+    "PROFILE_RECHECK_INTERVAL",
     "RESOURCES_DIRECTORY",
     "UserImporter",
     "root",
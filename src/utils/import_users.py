@@ -1,8 +1,8 @@
-import json
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -39,20 +39,22 @@ class UserImporter:
             db.close()
 
     def _load_users_from_json(self, file_path: Path) -> set[str]:
-        """Load unique usernames from a JSON file."""
+        """Load unique usernames from a JSON file.
+
+        The raw bytes are handed to orjson, skipping the text decode step.
+        """
         if not file_path.exists():
             self.logger.warning("JSON file not found: %s", file_path)
             return set()
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return {str(user).lower() for user in data if isinstance(user, str)}
-                self.logger.warning("JSON file does not contain a list: %s", file_path)
-                return set()
-        except (json.JSONDecodeError, OSError):
+            data = orjson.loads(file_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
             self.logger.exception("Error reading or parsing JSON file %s", file_path)
             return set()
+        if isinstance(data, list):
+            return {user.lower() for user in data if isinstance(user, str)}
+        self.logger.warning("JSON file does not contain a list: %s", file_path)
+        return set()
 
     @staticmethod
     def _build_user_map(public_users: Iterable[str], private_users: Iterable[str]) -> dict[str, bool]:
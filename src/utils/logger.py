@@ -1,4 +1,5 @@
 import datetime
+import functools
 import logging
 from logging import DEBUG, Formatter, StreamHandler, getLogger, root
 from logging.handlers import TimedRotatingFileHandler
@@ -7,14 +8,22 @@ from sys import stdout
 from src.utils.settings import LOG_DIRECTORY
 
 
+@functools.cache
 def setup_logging(log_level: int | None = None) -> logging.Logger:
     """Configure application logging with rotation and formatting.
 
+    The configuration is memoized, so repeated calls return the already
+    configured logger instead of reopening the log file handlers.
+
     :param log_level: Optional custom log level (defaults to DEBUG if None).
     :type log_level: Optional[int]
     :return: The configured root logger.
     :rtype: logging.Logger
     """
+    # No formatter prints process details, so records need not look them up.
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     for handler in root.handlers[:]:
         root.removeHandler(handler)
 
@@ -1,18 +1,26 @@
+import os
+from datetime import timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-RESOURCES_DIRECTORY = Path(__file__).absolute().parents[2] / "src" / "resources"
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+RESOURCES_DIRECTORY = PROJECT_ROOT / "src" / "resources"
 
-load_dotenv(RESOURCES_DIRECTORY.parents[2])
+load_dotenv(PROJECT_ROOT / ".env")
 
 DOWNLOAD_DIRECTORY = RESOURCES_DIRECTORY / "downloads"
 DOWNLOAD_DIRECTORY.mkdir(parents=True, exist_ok=True)
 
-LOG_DIRECTORY = RESOURCES_DIRECTORY / "logs"
+LOG_DIRECTORY = Path(os.getenv("LOG_DIRECTORY", RESOURCES_DIRECTORY / "logs"))
 LOG_DIRECTORY.mkdir(parents=True, exist_ok=True)
 
 LATEST_STAMPS = RESOURCES_DIRECTORY / "latest_stamps.ini"
+COOKIE_FILE_CACHE = RESOURCES_DIRECTORY / ".cookiefile"
 
 MAX_WORKERS = 16
+DOWNLOAD_WORKERS = 4
 BATCH_SIZE = 500
+
+# Private profiles found inaccessible are looked up again only after this long.
+PROFILE_RECHECK_INTERVAL = timedelta(hours=24)
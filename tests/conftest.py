@@ -0,0 +1,22 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+LOG_DIRECTORY = pytest.StashKey[str]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Send the logs written by the test run to a temporary directory.
+
+    Importing ``src`` already configures logging and runs the startup tasks,
+    so the directory is set before any test module is collected.
+    """
+    config.stash[LOG_DIRECTORY] = tempfile.mkdtemp(prefix="instalker-logs-")
+    os.environ["LOG_DIRECTORY"] = config.stash[LOG_DIRECTORY]
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the temporary log directory."""
+    shutil.rmtree(config.stash[LOG_DIRECTORY], ignore_errors=True)
@@ -102,3 +102,40 @@ def test_cli_list_with_users(db_session_cli: Session) -> None:  # noqa: ARG001
     assert "Public" in result.stdout
     assert "user2" in result.stdout
     assert "Private" in result.stdout
+
+
+def test_cli_list_filtered_by_privacy(db_session_cli: Session) -> None:  # noqa: ARG001
+    """Test 'list' command only shows users matching the privacy filter."""
+    runner.invoke(cli.app, ["add", "publicuser"])
+    runner.invoke(cli.app, ["add", "privateuser", "-p"])
+
+    result = runner.invoke(cli.app, ["list", "--privacy", "private"])
+    assert result.exit_code == 0
+    assert "privateuser" in result.stdout
+    assert "publicuser" not in result.stdout
+
+
+def test_cli_add_multiple_users(db_session_cli: Session) -> None:
+    """Test 'add' command with several usernames, skipping the existing ones."""
+    runner.invoke(cli.app, ["add", "existinguser"])
+    result = runner.invoke(cli.app, ["add", "newuser1", "existinguser", "newuser2"])
+    assert result.exit_code == 0
+    assert "User 'newuser1' added to the database as a public profile." in result.stdout
+    assert "User 'newuser2' added to the database as a public profile." in result.stdout
+    assert "User 'existinguser' already exists in the database." in result.stdout
+
+    usernames = {profile.username for profile in db_session_cli.query(Profile).all()}
+    assert usernames == {"existinguser", "newuser1", "newuser2"}
+
+
+def test_cli_remove_multiple_users(db_session_cli: Session) -> None:
+    """Test 'remove' command with several usernames, reporting the missing ones."""
+    runner.invoke(cli.app, ["add", "user1", "user2", "user3"])
+    result = runner.invoke(cli.app, ["remove", "user1", "missinguser", "user3"])
+    assert result.exit_code == 0
+    assert "User 'user1' removed from the database." in result.stdout
+    assert "User 'user3' removed from the database." in result.stdout
+    assert "User 'missinguser' not found in the database." in result.stdout
+
+    usernames = {profile.username for profile in db_session_cli.query(Profile).all()}
+    assert usernames == {"user2"}
@@ -0,0 +1,55 @@
+import pytest
+from instaloader import InstaloaderContext, instaloadercontext
+
+from src.core.connection_pool import KeepAliveAdapter, copy_session, install, reuse_connections
+
+
+def test_anonymous_sessions_share_the_adapter() -> None:
+    """Test that every anonymous session of a context is mounted on the shared adapter."""
+    adapter = KeepAliveAdapter()
+    context = InstaloaderContext(quiet=True)
+    reuse_connections(context, adapter, KeepAliveAdapter())
+
+    with context.get_anonymous_session() as first, context.get_anonymous_session() as second:
+        assert first.get_adapter("https://scontent.cdninstagram.com/") is adapter
+        assert second.get_adapter("https://scontent.cdninstagram.com/") is adapter
+
+
+def test_closing_a_session_keeps_the_pool() -> None:
+    """Test that closing a session does not clear the shared connection pool."""
+    adapter = KeepAliveAdapter()
+    adapter.poolmanager.connection_from_url("https://scontent.cdninstagram.com/")
+    context = InstaloaderContext(quiet=True)
+    reuse_connections(context, adapter, KeepAliveAdapter())
+
+    context.get_anonymous_session().close()
+
+    assert len(adapter.poolmanager.pools) == 1
+    adapter.shutdown()
+    assert len(adapter.poolmanager.pools) == 0
+
+
+def test_query_sessions_keep_hooks_and_pool() -> None:
+    """Test that the per-query copies of the logged-in session keep its hooks and pool."""
+    api_adapter = KeepAliveAdapter()
+    context = InstaloaderContext(quiet=True)
+    reuse_connections(context, KeepAliveAdapter(), api_adapter)
+
+    def hook(*_args: object, **_kwargs: object) -> None:
+        pass
+
+    context._session.hooks["response"].append(hook)  # noqa: SLF001
+
+    with copy_session(context._session) as query_session:  # noqa: SLF001
+        assert query_session.get_adapter("https://www.instagram.com/") is api_adapter
+        assert hook in query_session.hooks["response"]
+
+
+def test_install_replaces_instaloader_copy_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that installing twice leaves instaloader using the pooled copy_session."""
+    monkeypatch.setattr(instaloadercontext, "copy_session", instaloadercontext.copy_session)
+
+    install()
+    install()
+
+    assert instaloadercontext.copy_session is copy_session
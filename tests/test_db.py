@@ -1,11 +1,14 @@
 from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.core.db import Base, Profile
+import src.core
+from src.core import get_session
+from src.core.db import Base, Profile, set_sqlite_pragmas
 
 
 @pytest.fixture(name="db_session")
@@ -75,3 +78,27 @@ def test_delete_profile(db_session: Session) -> None:
 
     deleted_profile = db_session.query(Profile).filter_by(username="deleteuser").first()
     assert deleted_profile is None
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path: Path) -> None:
+    """Test that new SQLite connections are switched to WAL with relaxed syncing."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'instalker.db'}")
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+    engine.dispose()
+
+
+def test_get_session_commits_on_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that get_session commits the work done in its block."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(src.core, "SessionLocal", sessionmaker(bind=engine))
+
+    with get_session() as db:
+        db.add(Profile(username="committeduser", is_private=False))
+
+    with Session(engine) as db:
+        assert db.query(Profile).filter_by(username="committeduser").first() is not None
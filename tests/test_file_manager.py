@@ -0,0 +1,52 @@
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.core import file_manager
+from src.core.file_manager import FileManager
+
+
+@pytest.fixture(name="download_dir")
+def download_dir_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture pointing the FileManager at a temporary download directory."""
+    monkeypatch.setattr(file_manager, "DOWNLOAD_DIRECTORY", tmp_path)
+    return tmp_path
+
+
+def test_get_files_recurses_and_filters_extensions(download_dir: Path) -> None:
+    """Test that media files are found in subdirectories and other files are ignored."""
+    (download_dir / "user").mkdir()
+    (download_dir / "user" / "post.JPG").touch()
+    (download_dir / "user" / "caption.txt").touch()
+    (download_dir / "story.mp4").touch()
+
+    fm = FileManager()
+
+    assert sorted(fm.media_files) == [download_dir / "story.mp4", download_dir / "user" / "post.JPG"]
+
+
+def test_get_files_skips_broken_symlinks(download_dir: Path) -> None:
+    """Test that dangling media symlinks are not reported as media files."""
+    (download_dir / "broken.png").symlink_to(download_dir / "missing.png")
+
+    fm = FileManager()
+
+    assert fm.media_files == []
+
+
+def test_remove_old_files_keeps_recent_media(download_dir: Path) -> None:
+    """Test that only media older than the cutoff is removed."""
+    (download_dir / "user").mkdir()
+    old_file = download_dir / "user" / "old.jpg"
+    new_file = download_dir / "user" / "new.jpg"
+    old_file.touch()
+    new_file.touch()
+    old_mtime = (datetime.now(tz=UTC) - timedelta(days=40)).timestamp()
+    os.utime(old_file, (old_mtime, old_mtime))
+
+    FileManager().remove_old_files(cutoff_delta=timedelta(days=30))
+
+    assert not old_file.exists()
+    assert new_file.exists()
@@ -0,0 +1,220 @@
+import sqlite3
+import time
+from collections.abc import Generator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from instaloader import AbortDownloadException, ConnectionException, Instaloader, instaloadercontext
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import JSONDecodeError
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core import instagram as instagram_module
+from src.core.db import Base, Profile
+from src.core.instagram import Instagram
+from src.core.rate_controller import Backoff
+
+
+class _StubAdapter(HTTPAdapter):
+    """Adapter answering each request with the next canned status code and body."""
+
+    def __init__(self, *responses: tuple[int, bytes]) -> None:
+        super().__init__()
+        self.responses = list(responses)
+
+    def send(self, request: PreparedRequest, *_args: Any, **_kwargs: Any) -> Response:
+        status_code, body = self.responses.pop(0)
+        response = Response()
+        response.status_code = status_code
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+        response._content = body  # noqa: SLF001
+        response.encoding = "utf-8"
+        response.request = request
+        response.url = request.url or ""
+        return response
+
+
+@pytest.fixture(name="db_session")
+def db_session_fixture() -> Generator[Session, Any]:
+    """Fixture for a in-memory SQLite database session."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(name="profiles_root")
+def profiles_root_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture for an empty Firefox profiles root and cookie path cache."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(instagram_module, "FIREFOX_PROFILES_ROOT", "profiles")
+    monkeypatch.setattr(instagram_module, "COOKIE_FILE_CACHE", tmp_path / ".cookiefile")
+    monkeypatch.setattr(Instagram, "_cookie_file", None)
+    return tmp_path / "profiles"
+
+
+def _create_cookie_file(profiles_root: Path, profile: str) -> Path:
+    cookie_file = profiles_root / profile / "cookies.sqlite"
+    cookie_file.parent.mkdir(parents=True)
+    cookie_file.touch()
+    return cookie_file
+
+
+@pytest.fixture(name="instagram")
+def instagram_fixture(db_session: Session, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Instagram:
+    """Fixture for a single-worker Instagram reading an empty cookie database."""
+    cookie_file = tmp_path / "cookies.sqlite"
+    sqlite3.connect(cookie_file).close()
+    monkeypatch.setattr(Instagram, "_get_cookie_file", staticmethod(lambda: str(cookie_file)))
+    monkeypatch.setattr(instagram_module, "LATEST_STAMPS", tmp_path / "latest_stamps.ini")
+    # Restored after the test, since Instagram installs its own copy_session.
+    monkeypatch.setattr(instaloadercontext, "copy_session", instaloadercontext.copy_session)
+    return Instagram(db=db_session, users={"alice", "bob", "carol"}, workers=1)
+
+
+def test_abort_stops_queued_users(instagram: Instagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a fatal response skips the queued users and keeps the saved profiles."""
+    looked_up: list[str] = []
+
+    def get_profile(username: str, _loader: Instaloader) -> None:
+        looked_up.append(username)
+        if username == "alice":
+            msg = 'Query responded with "400 Bad Request": {"message": "checkpoint_required"}'
+            raise AbortDownloadException(msg)
+
+    monkeypatch.setattr(instagram, "_get_instagram_profile", get_profile)
+    instagram.db.add(Profile(username="saved", is_private=False))
+    instagram._pending_upserts = 1  # noqa: SLF001
+
+    with pytest.raises(AbortDownloadException):
+        instagram._download()  # noqa: SLF001
+
+    assert looked_up == ["alice"]
+    instagram.db.rollback()
+    assert instagram.db.scalars(select(Profile.username)).all() == ["saved"]
+
+
+def test_unexpected_error_skips_only_that_user(instagram: Instagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an unexpected error for one user is logged and the other users still run."""
+    looked_up: list[str] = []
+
+    def get_profile(username: str, _loader: Instaloader) -> None:
+        looked_up.append(username)
+        if username == "alice":
+            msg = "disk full"
+            raise OSError(msg)
+
+    monkeypatch.setattr(instagram, "_get_instagram_profile", get_profile)
+
+    instagram._download()  # noqa: SLF001
+
+    assert looked_up == ["alice", "bob", "carol"]
+
+
+def _fake_profile(username: str, hashtags: list[str]) -> Any:
+    return SimpleNamespace(
+        username=username,
+        full_name=username.title(),
+        biography="",
+        followers=0,
+        followees=0,
+        mediacount=0,
+        business_category_name=None,
+        external_url=None,
+        is_private=False,
+        blocked_by_viewer=False,
+        followed_by_viewer=False,
+        follows_viewer=False,
+        biography_hashtags=hashtags,
+        biography_mentions=[],
+    )
+
+
+def test_failed_upsert_keeps_the_pending_batch(instagram: Instagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a database error upserting one profile only discards that profile."""
+    assert instagram._upsert_profile_to_db(_fake_profile("alice", [])) is not None  # noqa: SLF001
+
+    def fail(*_args: Any) -> None:
+        msg = "constraint failed"
+        raise SQLAlchemyError(msg)
+
+    monkeypatch.setattr(instagram, "_get_or_create_item", fail)
+
+    assert instagram._upsert_profile_to_db(_fake_profile("bob", ["travel"])) is None  # noqa: SLF001
+    instagram.db.commit()
+    assert instagram.db.scalars(select(Profile.username)).all() == ["alice"]
+
+
+def test_429_backs_off_and_retries(instagram: Instagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a 429 from Instagram waits for the shared backoff and retries the query."""
+    clock = [0.0]
+
+    def fake_sleep(secs: float) -> None:
+        clock[0] += secs
+
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+    context = instagram.loader.context
+    context._session.mount("https://", _StubAdapter((429, b"{}"), (200, b'{"status": "ok"}')))  # noqa: SLF001
+
+    assert context.get_json("api/v1/users/web_profile_info/", {}) == {"status": "ok"}
+    assert clock[0] >= Backoff.BASE
+
+
+def test_429_delays_the_other_workers(instagram: Instagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a 429 received by one worker makes the workers sharing its backoff wait too."""
+    clock = [0.0]
+    other_waits: list[float] = []
+    other = instagram._create_loader().context._rate_controller  # noqa: SLF001
+
+    def fake_sleep(secs: float) -> None:
+        other_waits.append(other.query_waittime("other", clock[0]))
+        clock[0] += secs
+
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+    context = instagram.loader.context
+    context._session.mount("https://", _StubAdapter((429, b"{}"), (200, b'{"status": "ok"}')))  # noqa: SLF001
+
+    context.get_json("api/v1/users/web_profile_info/", {})
+
+    assert max(other_waits) >= Backoff.BASE
+
+
+def test_malformed_json_is_retried_then_reported(instagram: Instagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a body orjson cannot decode goes through instaloader's JSON error handling."""
+    monkeypatch.setattr(time, "sleep", lambda _secs: None)
+    context = instagram.loader.context
+    attempts = [(200, b"<html>")] * context.max_connection_attempts
+    context._session.mount("https://", _StubAdapter(*attempts))  # noqa: SLF001
+
+    with pytest.raises(ConnectionException) as exc_info:
+        context.get_json("api/v1/users/web_profile_info/", {})
+
+    assert isinstance(exc_info.value.__cause__, JSONDecodeError)
+
+
+def test_missing_cookie_file_is_looked_up_again(profiles_root: Path) -> None:
+    """Test that a failed cookie lookup is not memoized."""
+    assert Instagram._get_cookie_file() is None  # noqa: SLF001
+
+    cookie_file = _create_cookie_file(profiles_root, "abc.default")
+
+    assert Instagram._get_cookie_file() == str(cookie_file)  # noqa: SLF001
+
+
+def test_stale_cookie_cache_is_replaced(profiles_root: Path) -> None:
+    """Test that a cached cookie path whose profile is gone is looked up and cached again."""
+    instagram_module.COOKIE_FILE_CACHE.write_text(str(profiles_root / "deleted" / "cookies.sqlite"), encoding="utf-8")
+    cookie_file = _create_cookie_file(profiles_root, "abc.default")
+
+    assert Instagram._get_cookie_file() == str(cookie_file)  # noqa: SLF001
+    assert instagram_module.COOKIE_FILE_CACHE.read_text(encoding="utf-8") == str(cookie_file)
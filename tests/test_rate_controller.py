@@ -0,0 +1,133 @@
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+from instaloader import InstaloaderContext
+from requests import Response
+
+from src.core.rate_controller import AdaptiveRateController, Backoff, QueryHistory
+
+RETRY_AFTER = 120
+
+
+@pytest.fixture(name="controller")
+def controller_fixture() -> AdaptiveRateController:
+    """Fixture for a rate controller bound to a fresh, anonymous Instaloader context."""
+    context = InstaloaderContext(quiet=True, rate_controller=AdaptiveRateController)
+    return context._rate_controller  # type: ignore[return-value] # noqa: SLF001
+
+
+def _response(status_code: int = 200, headers: dict[str, str] | None = None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.url = "https://www.instagram.com/graphql/query"
+    response.headers.update(headers or {})
+    return response
+
+
+def test_no_hint_keeps_default_waittime(controller: AdaptiveRateController) -> None:
+    """Test that responses without rate-limit headers do not delay queries."""
+    controller._record_response(_response())  # noqa: SLF001
+    assert controller.query_waittime("other", time.monotonic()) == 0
+
+
+def test_retry_after_seconds_delays_next_query(controller: AdaptiveRateController) -> None:
+    """Test that a numeric Retry-After header pushes back the next query."""
+    controller._record_response(_response(headers={"Retry-After": str(RETRY_AFTER)}))  # noqa: SLF001
+    waittime = controller.query_waittime("other", time.monotonic())
+    assert RETRY_AFTER - 10 < waittime <= RETRY_AFTER
+
+
+def test_retry_after_date_without_zone_delays_next_query(controller: AdaptiveRateController) -> None:
+    """Test that a Retry-After HTTP date in the "-0000" zone is read as UTC."""
+    retry_at = format_datetime(datetime.now(UTC).replace(tzinfo=None) + timedelta(seconds=RETRY_AFTER))
+    assert retry_at.endswith("-0000")
+
+    controller._record_response(_response(headers={"Retry-After": retry_at}))  # noqa: SLF001
+
+    waittime = controller.query_waittime("other", time.monotonic())
+    assert RETRY_AFTER - 10 < waittime <= RETRY_AFTER
+
+
+def test_malformed_retry_after_is_ignored(controller: AdaptiveRateController) -> None:
+    """Test that an unparsable Retry-After header is ignored."""
+    controller._record_response(_response(headers={"Retry-After": "soon"}))  # noqa: SLF001
+    assert controller.query_waittime("other", time.monotonic()) == 0
+
+
+def test_exhausted_budget_backs_off(controller: AdaptiveRateController) -> None:
+    """Test that an exhausted X-RateLimit-Remaining budget delays the next query."""
+    controller._record_response(_response(headers={"X-RateLimit-Remaining": "0"}))  # noqa: SLF001
+    assert controller.query_waittime("other", time.monotonic()) > 0
+
+
+def test_shared_backoff_delays_every_controller() -> None:
+    """Test that a hint received by one controller delays controllers sharing its backoff."""
+    backoff = Backoff()
+    first = AdaptiveRateController(InstaloaderContext(quiet=True), backoff=backoff)
+    second = AdaptiveRateController(InstaloaderContext(quiet=True), backoff=backoff)
+
+    first._record_response(_response(headers={"Retry-After": str(RETRY_AFTER)}))  # noqa: SLF001
+
+    assert second.query_waittime("other", time.monotonic()) > 0
+
+
+def test_success_during_backoff_keeps_it_growing(controller: AdaptiveRateController) -> None:
+    """Test that a query answered before the backoff deadline does not reset the 429 count."""
+    backoff = controller._backoff  # noqa: SLF001
+    backoff.record_429()
+    controller._record_response(_response())  # noqa: SLF001
+
+    backoff.record_429()
+
+    assert backoff.remaining(time.monotonic()) > Backoff.BASE
+
+
+def test_success_after_backoff_resets_it(controller: AdaptiveRateController, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a query answered once the backoff has elapsed starts the next one from the base."""
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    backoff = controller._backoff  # noqa: SLF001
+    backoff.record_429()
+    clock[0] += Backoff.BASE
+    controller._record_response(_response())  # noqa: SLF001
+
+    backoff.record_429()
+
+    assert backoff.remaining(clock[0]) == pytest.approx(Backoff.BASE)
+
+
+def test_sleep_honours_backoff_pushed_while_waiting(
+    controller: AdaptiveRateController, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a sleep is extended when another worker pushes the shared backoff back."""
+    clock = [0.0]
+    sleeps: list[float] = []
+    backoff = controller._backoff  # noqa: SLF001
+
+    def fake_sleep(secs: float) -> None:
+        if not sleeps:
+            backoff.push_back(RETRY_AFTER)
+        sleeps.append(secs)
+        clock[0] += secs
+
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+
+    controller.sleep(5)
+
+    assert len(sleeps) == 2  # noqa: PLR2004
+    assert clock[0] == pytest.approx(RETRY_AFTER)
+
+
+def test_shared_history_counts_queries_of_every_controller() -> None:
+    """Test that queries made through one controller use up the budget of the others."""
+    history = QueryHistory()
+    first = AdaptiveRateController(InstaloaderContext(quiet=True), history=history)
+    second = AdaptiveRateController(InstaloaderContext(quiet=True), history=history)
+
+    for _ in range(first.count_per_sliding_window("other")):
+        first.wait_before_query("other")
+
+    assert second.query_waittime("other", time.monotonic()) > 0